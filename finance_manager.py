@@ -1,4 +1,53 @@
-from datetime import datetime
+import sys
+import time
+from collections import deque
+from functools import lru_cache
+
+# Кеш форматування часу: пара (секунди, рядок) замінюється одним присвоєнням,
+# тож паралельний читач не побачить секунди від одного запису, а рядок від іншого.
+_last_ts = (0, "")
+
+# Шаблон текстового представлення рахунку; статус індексується станом заморожування.
+_STATUSES = ("Активний", "Заморожено")
+_ACCOUNT_FMT = "Рахунок: {} | Баланс: {} {} | Статус: {}".format
+
+
+def _format_timestamp(ts: float) -> str:
+    """
+    @brief Форматування часу операції для історії.
+
+    @details Формат має секундну точність, тому рядок форматується лише раз на секунду,
+    а для решти записів у межах тієї ж секунди повертається кешоване значення.
+    @param ts Час у секундах від початку епохи (float), як повертає time.time().
+    @return Рядок виду "YYYY-MM-DD HH:MM:SS".
+    """
+    global _last_ts
+    seconds = int(ts)
+    cached_seconds, cached_str = _last_ts
+    if seconds == cached_seconds:
+        return cached_str
+    formatted = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+    _last_ts = (seconds, formatted)
+    return formatted
+
+
+@lru_cache(maxsize=64, typed=True)
+def _interest_label(rate: float) -> str:
+    """
+    @brief Підпис операції нарахування відсотків (кешується для кожної ставки).
+    @param rate Відсоткова ставка (float).
+    """
+    return f"Відсотки ({rate}%)"
+
+
+@lru_cache(maxsize=1024)
+def _transfer_label(owner: str) -> str:
+    """
+    @brief Підпис операції переказу (кешується для кожного отримувача).
+    @param owner Ім'я власника рахунку отримувача (str).
+    """
+    return f"Переказ до {owner}"
+
 
 class BankAccount:
     """
@@ -9,39 +58,58 @@ class BankAccount:
     Підтримує ведення історії транзакцій.
     """
 
-    def __init__(self, owner: str, initial_balance: float = 0.0, currency: str = "UAH"):
+    __slots__ = ("owner", "balance", "currency",
+                 "_hist_ts", "_hist_action", "_hist_amount", "_hist_bal")
+
+    # Стан заморожування визначається класом: _FrozenAccount перекриває значення на True.
+    _frozen = False
+
+    def __init__(self, owner: str, initial_balance: float = 0.0, currency: str = "UAH",
+                 history_capacity: int | None = None):
         """
         @brief Конструктор класу BankAccount.
         
         @param owner Ім'я власника рахунку (str).
         @param initial_balance Початковий баланс (float). За замовчуванням 0.0.
         @param currency Валюта рахунку (str). За замовчуванням "UAH".
-        @throws ValueError Якщо initial_balance < 0.
+        @param history_capacity Максимальна кількість записів в історії (int). За замовчуванням
+        None — історія необмежена; інакше зберігаються лише останні записи.
+        @throws ValueError Якщо initial_balance < 0 або history_capacity < 1.
         """
         if initial_balance < 0:
             raise ValueError("Початковий баланс не може бути від'ємним.")
+        if history_capacity is not None and history_capacity < 1:
+            raise ValueError("Розмір історії має бути додатним.")
         
         self.owner = owner
         self.balance = initial_balance
-        self.currency = currency
-        self.is_frozen = False
-        self.transaction_history = [] 
-        self._log_transaction("Створення рахунку", initial_balance)
+        # Коди валют інтернуються, тож рахунки в одній валюті посилаються на один рядок.
+        # sys.intern приймає лише точний тип str (не підкласи, напр. StrEnum).
+        self.currency = sys.intern(currency) if type(currency) is str else currency
+        # Історія зберігається по стовпцях: час, дія, сума, баланс після операції.
+        # Стовпці зберігають вихідні об'єкти (int, float, Decimal) без перетворення типів,
+        # тому додавання запису не може завершитися помилкою посередині.
+        # При history_capacity=None черги необмежені.
+        self._hist_ts = deque(maxlen=history_capacity)
+        self._hist_action = deque(maxlen=history_capacity)
+        self._hist_amount = deque(maxlen=history_capacity)
+        self._hist_bal = deque(maxlen=history_capacity)
+        self._log_transaction("Створення рахунку", initial_balance, initial_balance)
 
-    def _log_transaction(self, action: str, amount: float):
+    def _log_transaction(self, action: str, amount: float, balance: float):
         """
         @brief Внутрішній метод для запису операції в історію.
-        
+
+        @details Усі операції, крім deposit() та withdraw() (де той самий запис вбудовано
+        заради швидкодії), викликають його вже після обчислення нового балансу.
         @param action Опис дії (str).
         @param amount Сума операції (float).
+        @param balance Баланс після операції (float).
         """
-        record = {
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "action": action,
-            "amount": amount,
-            "balance_after": self.balance
-        }
-        self.transaction_history.append(record)
+        self._hist_ts.append(time.time())
+        self._hist_action.append(action)
+        self._hist_amount.append(amount)
+        self._hist_bal.append(balance)
 
     def deposit(self, amount: float):
         """
@@ -52,14 +120,17 @@ class BankAccount:
         @throws ValueError Якщо amount <= 0.
         @throws PermissionError Якщо рахунок заморожено.
         """
-        if self.is_frozen:
-            raise PermissionError("Рахунок заморожено. Операції заборонені.")
         if amount <= 0:
             raise ValueError("Сума поповнення має бути більше нуля.")
         
-        self.balance += amount
-        self._log_transaction("Поповнення", amount)
-        return self.balance
+        balance = self.balance + amount
+        self.balance = balance
+        # Запис в історію вбудовано замість виклику _log_transaction (гарячий шлях).
+        self._hist_ts.append(time.time())
+        self._hist_action.append("Поповнення")
+        self._hist_amount.append(amount)
+        self._hist_bal.append(balance)
+        return balance
 
     def withdraw(self, amount: float):
         """
@@ -70,16 +141,51 @@ class BankAccount:
         @throws ValueError Якщо amount <= 0 або недостатньо коштів.
         @throws PermissionError Якщо рахунок заморожено.
         """
-        if self.is_frozen:
-            raise PermissionError("Рахунок заморожено. Операції заборонені.")
         if amount <= 0:
             raise ValueError("Сума зняття має бути більше нуля.")
-        if amount > self.balance:
+        balance = self.balance
+        if amount > balance:
             raise ValueError("Недостатньо коштів на рахунку.")
         
-        self.balance -= amount
-        self._log_transaction("Зняття", -amount)
-        return self.balance
+        balance -= amount
+        self.balance = balance
+        # Запис в історію вбудовано замість виклику _log_transaction (гарячий шлях).
+        self._hist_ts.append(time.time())
+        self._hist_action.append("Зняття")
+        self._hist_amount.append(-amount)
+        self._hist_bal.append(balance)
+        return balance
+
+    def deposit_unchecked(self, amount: float):
+        """
+        @brief Поповнення рахунку без перевірок (для пакетного імпорту).
+
+        @details Виклик має сам гарантувати, що amount > 0 і рахунок не заморожено:
+        ці умови тут не перевіряються. Метод не заблокований і на замороженому рахунку —
+        заборона операцій після freeze_account() діє лише для deposit(), withdraw() та
+        apply_interest().
+        @param amount Сума поповнення (float).
+        @return Оновлений баланс (float).
+        """
+        balance = self.balance + amount
+        self.balance = balance
+        self._log_transaction("Поповнення", amount, balance)
+        return balance
+
+    def withdraw_unchecked(self, amount: float):
+        """
+        @brief Зняття коштів без перевірок (для пакетного імпорту).
+
+        @details Виклик має сам гарантувати, що 0 < amount <= balance і рахунок не заморожено:
+        ці умови тут не перевіряються. Як і deposit_unchecked(), метод не заблокований
+        на замороженому рахунку.
+        @param amount Сума зняття (float).
+        @return Оновлений баланс (float).
+        """
+        balance = self.balance - amount
+        self.balance = balance
+        self._log_transaction("Зняття", -amount, balance)
+        return balance
 
     def transfer(self, other_account, amount: float):
         """
@@ -88,29 +194,98 @@ class BankAccount:
         @param other_account Об'єкт BankAccount отримувача.
         @param amount Сума переказу (float).
         @throws TypeError Якщо other_account не є екземпляром BankAccount.
-        @throws ValueError Якщо валюти рахунків відрізняються.
+        @throws ValueError Якщо валюти рахунків відрізняються, amount <= 0 або недостатньо коштів.
+        @throws PermissionError Якщо рахунок відправника або отримувача заморожено.
         """
-        if not isinstance(other_account, BankAccount):
+        if type(other_account) is not BankAccount and not isinstance(other_account, BankAccount):
             raise TypeError("Отримувач має бути екземпляром BankAccount.")
-        if self.currency != other_account.currency:
+        currency = self.currency
+        if currency is not other_account.currency and currency != other_account.currency:
             raise ValueError("Переказ можливий тільки між рахунками в одній валюті.")
-        
-        self.withdraw(amount)
-        try:
-            other_account.deposit(amount)
-        except Exception as e:
-            self.balance += amount 
-            raise e
+        if amount <= 0:
+            raise ValueError("Сума переказу має бути більше нуля.")
+        if amount > self.balance:
+            raise ValueError("Недостатньо коштів на рахунку.")
+
+        # Спочатку зарахування: якщо отримувач відмовить, рахунок відправника не змінюється.
+        other_account.deposit(amount)
+
+        balance = self.balance - amount
+        self.balance = balance
+        self._log_transaction(_transfer_label(other_account.owner), -amount, balance)
+
+    def transfer_many(self, pairs):
+        """
+        @brief Пакетний переказ коштів на кілька рахунків.
+
+        @details Усі перевірки (стан рахунків, валюти, суми, достатність коштів) виконуються
+        один раз для всього пакета до будь-яких змін, тож при помилці жоден рахунок
+        не змінюється. Достатність коштів перевіряється за поточним залишком після кожного
+        переказу, як і при послідовних викликах transfer(), тому баланс не стає від'ємним
+        через округлення. Баланс відправника записується один раз, а зарахування
+        проводяться через deposit_unchecked().
+        @param pairs Послідовність пар (BankAccount отримувача, сума переказу).
+        @return Оновлений баланс (float).
+        @throws TypeError Якщо отримувач не є екземпляром BankAccount.
+        @throws ValueError Якщо валюти відрізняються, сума <= 0 або недостатньо коштів.
+        @throws PermissionError Якщо рахунок відправника або отримувача заморожено.
+        """
+        pairs = list(pairs)
+        currency = self.currency
+        balance = self.balance
+        balances_after = []
+        for other_account, amount in pairs:
+            if type(other_account) is not BankAccount and not isinstance(other_account, BankAccount):
+                raise TypeError("Отримувач має бути екземпляром BankAccount.")
+            if currency is not other_account.currency and currency != other_account.currency:
+                raise ValueError("Переказ можливий тільки між рахунками в одній валюті.")
+            if amount <= 0:
+                raise ValueError("Сума переказу має бути більше нуля.")
+            if other_account.is_frozen:
+                raise PermissionError("Рахунок отримувача заморожено. Операції заборонені.")
+            if amount > balance:
+                raise ValueError("Недостатньо коштів на рахунку.")
+            balance -= amount
+            balances_after.append(balance)
+
+        self.balance = balance
+        for (other_account, amount), balance_after in zip(pairs, balances_after):
+            self._log_transaction(_transfer_label(other_account.owner), -amount, balance_after)
+        for other_account, amount in pairs:
+            other_account.deposit_unchecked(amount)
+        return self.balance
+
+    @property
+    def is_frozen(self):
+        """
+        @brief Чи заморожено рахунок.
+
+        @details Стан визначається класом об'єкта, тому не може розійтися з поведінкою операцій.
+        Присвоєння значення еквівалентне виклику freeze_account() або unfreeze_account().
+        """
+        return self._frozen
 
-        self.transaction_history[-1]["action"] = f"Переказ до {other_account.owner}"
+    @is_frozen.setter
+    def is_frozen(self, value: bool):
+        if value:
+            self.freeze_account()
+        else:
+            self.unfreeze_account()
 
     def freeze_account(self):
-        """@brief Заморозити рахунок (заборонити операції)."""
-        self.is_frozen = True
+        """
+        @brief Заморозити рахунок (заборонити операції).
+
+        @details Замість перевірки прапорця в кожній операції об'єкт перемикається
+        на заморожений варіант свого класу, методи якого лише кидають PermissionError.
+        """
+        if not self._frozen:
+            self.__class__ = _frozen_class(type(self))
 
     def unfreeze_account(self):
         """@brief Розморозити рахунок."""
-        self.is_frozen = False
+        if self._frozen:
+            self.__class__ = self._active_class
 
     def apply_interest(self, rate: float):
         """
@@ -121,24 +296,246 @@ class BankAccount:
         @throws PermissionError Якщо рахунок заморожено.
         @throws ValueError Якщо rate <= 0.
         """
-        if self.is_frozen:
-            raise PermissionError("Не можна нараховувати відсотки на заморожений рахунок.")
         if rate <= 0:
             raise ValueError("Відсоткова ставка має бути додатною.")
         
-        interest_amount = self.balance * (rate / 100)
-        self.balance += interest_amount
-        self._log_transaction(f"Відсотки ({rate}%)", interest_amount)
-        return self.balance
+        balance = self.balance
+        interest_amount = balance * (rate / 100)
+        balance += interest_amount
+        self.balance = balance
+        self._log_transaction(_interest_label(rate), interest_amount, balance)
+        return balance
+
+    @classmethod
+    def apply_interest_bulk(cls, accounts, rates):
+        """
+        @brief Нарахування відсотків на залишок для групи рахунків.
+
+        @details Відсотки рахуються так само, як в apply_interest(), а підписи операцій
+        беруться з кешу для кожної ставки. Усі рахунки та ставки перевіряються до змін, тому при помилці жоден баланс не змінюється.
+        @param accounts Послідовність об'єктів BankAccount.
+        @param rates Одна ставка для всіх рахунків (наприклад, 5.0 для 5%) або послідовність
+        ставок тієї ж довжини, що й accounts.
+        @return Список оновлених балансів (list[float]) у порядку рахунків.
+        @throws PermissionError Якщо хоча б один рахунок заморожено.
+        @throws ValueError Якщо будь-яка ставка <= 0 або кількість ставок не збігається з кількістю рахунків.
+        """
+        accounts = list(accounts)
+        if hasattr(rates, "__iter__"):
+            rates = list(rates)
+            if len(rates) != len(accounts):
+                raise ValueError("Кількість ставок має збігатися з кількістю рахунків.")
+        else:
+            rates = [rates] * len(accounts)
+        for account, rate in zip(accounts, rates):
+            if rate <= 0:
+                raise ValueError("Відсоткова ставка має бути додатною.")
+            if account.is_frozen:
+                raise PermissionError("Не можна нараховувати відсотки на заморожений рахунок.")
+
+        balances = []
+        for account, rate in zip(accounts, rates):
+            balance = account.balance
+            interest_amount = balance * (rate / 100)
+            balance += interest_amount
+            account.balance = balance
+            account._log_transaction(_interest_label(rate), interest_amount, balance)
+            balances.append(balance)
+        return balances
+
+    def iter_history(self):
+        """
+        @brief Послідовний перегляд історії транзакцій без створення її копії.
+
+        @details Записи збираються у словники по одному під час ітерації. Історію не слід
+        змінювати (проводити операції) до завершення перебору.
+        @return Ітератор словників (dict) з деталями транзакцій.
+        """
+        for ts, action, amount, bal in zip(self._hist_ts, self._hist_action,
+                                           self._hist_amount, self._hist_bal):
+            yield {"date": _format_timestamp(ts), "action": action, "amount": amount, "balance_after": bal}
 
     def get_history(self):
         """
         @brief Отримати історію транзакцій.
+        @details Записи збираються у словники на вимогу зі стовпцевого сховища.
+        Для простого перебору без створення списку використовуйте iter_history().
         @return Список словників (list[dict]) з деталями транзакцій.
         """
-        return self.transaction_history[:]
+        return list(self.iter_history())
+
+    def __getstate__(self):
+        """
+        @brief Стан рахунку для серіалізації (pickle).
+
+        @details Клас використовує __slots__, тому стан збирається зі слотів явно;
+        це потрібно для протоколів pickle 0 та 1.
+        @return Словник {ім'я слота: значення}.
+        """
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        """
+        @brief Відновлення стану рахунку після десеріалізації (pickle).
+        @param state Словник, повернутий __getstate__().
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __reduce_ex__(self, protocol):
+        """
+        @brief Серіалізація (pickle) рахунку.
+
+        @details Заморожений клас створюється динамічно і не доступний за іменем у модулі,
+        тому зберігається вихідний клас рахунку та ознака заморожування.
+        """
+        cls = self._active_class if self._frozen else type(self)
+        return (_restore_account, (cls, self._frozen), self.__getstate__())
 
     def __str__(self):
         """@brief Текстове представлення рахунку."""
-        status = "Заморожено" if self.is_frozen else "Активний"
-        return f"Рахунок: {self.owner} | Баланс: {self.balance} {self.currency} | Статус: {status}"
+        return _ACCOUNT_FMT(self.owner, self.balance, self.currency, _STATUSES[self._frozen])
+
+
+class _FrozenAccount:
+    """
+    @brief Методи, що заміщують операції BankAccount для замороженого рахунку.
+    """
+
+    __slots__ = ()
+    _frozen = True
+
+    def deposit(self, amount: float):
+        """@throws PermissionError Рахунок заморожено."""
+        raise PermissionError("Рахунок заморожено. Операції заборонені.")
+
+    def withdraw(self, amount: float):
+        """@throws PermissionError Рахунок заморожено."""
+        raise PermissionError("Рахунок заморожено. Операції заборонені.")
+
+    def apply_interest(self, rate: float):
+        """@throws PermissionError Рахунок заморожено."""
+        raise PermissionError("Не можна нараховувати відсотки на заморожений рахунок.")
+
+    def transfer(self, other_account, amount: float):
+        """@throws PermissionError Рахунок заморожено."""
+        raise PermissionError("Рахунок заморожено. Операції заборонені.")
+
+    def transfer_many(self, pairs):
+        """@throws PermissionError Рахунок заморожено."""
+        raise PermissionError("Рахунок заморожено. Операції заборонені.")
+
+
+
+_frozen_classes = {}
+
+
+def _frozen_class(cls):
+    """
+    @brief Отримати заморожений варіант класу рахунку.
+
+    @param cls Клас BankAccount або його підклас.
+    @return Підклас cls з методами _FrozenAccount (створюється один раз на клас).
+    """
+    frozen = _frozen_classes.get(cls)
+    if frozen is None:
+        frozen = type(cls.__name__, (_FrozenAccount, cls), {"__slots__": (), "_active_class": cls})
+        _frozen_classes[cls] = frozen
+    return frozen
+
+
+def _restore_account(cls, frozen: bool):
+    """
+    @brief Створити порожній рахунок класу cls (для pickle); стан відновлює __setstate__().
+    @param cls Вихідний (незаморожений) клас рахунку.
+    @param frozen Чи був рахунок заморожений.
+    """
+    return object.__new__(_frozen_class(cls) if frozen else cls)
+
+
+def _restore_currency(currency, frozen: bool):
+    """
+    @brief Створити порожній рахунок класу make_account_class(currency) (для pickle).
+    @param currency Валюта класу рахунку.
+    @param frozen Чи був рахунок заморожений.
+    """
+    return _restore_account(make_account_class(currency), frozen)
+
+
+def _transfer_same_currency(self, other_account, amount: float):
+    """
+    @brief Переказ для класів, створених make_account_class().
+
+    @details Якщо отримувач має той самий клас, валюта гарантована типом (вона лише для читання),
+    тому перевірки типу та валюти пропускаються; решта кроків збігається з BankAccount.transfer().
+    Інакше виконується звичайний BankAccount.transfer().
+    """
+    if type(other_account) is not type(self):
+        return BankAccount.transfer(self, other_account, amount)
+    if amount <= 0:
+        raise ValueError("Сума переказу має бути більше нуля.")
+    if amount > self.balance:
+        raise ValueError("Недостатньо коштів на рахунку.")
+
+    other_account.deposit(amount)
+
+    balance = self.balance - amount
+    self.balance = balance
+    self._log_transaction(_transfer_label(other_account.owner), -amount, balance)
+
+
+def _fixed_currency(currency):
+    """
+    @brief Властивість currency для класів, створених make_account_class().
+
+    @details Валюта визначається класом і не зберігається в об'єкті; присвоєння іншого
+    значення заборонене, щоб переказ між рахунками класу не міг змішати валюти.
+    """
+    def get(self):
+        return currency
+
+    def set(self, value):
+        if value != currency:
+            raise AttributeError(f"Валюту рахунку визначає клас: {currency}.")
+
+    return property(get, set)
+
+
+_currency_classes = {}
+
+
+def make_account_class(currency: str):
+    """
+    @brief Отримати клас рахунку, спеціалізований для однієї валюти.
+
+    @details Клас створюється один раз для кожної валюти. Його конструктор не приймає
+    валюту, а переказ між рахунками цього класу не перевіряє тип і валюту отримувача.
+    @param currency Валюта рахунків класу (str), наприклад "UAH".
+    @return Підклас BankAccount з назвою виду BankAccount_UAH.
+    """
+    if type(currency) is str:
+        currency = sys.intern(currency)
+    cls = _currency_classes.get(currency)
+    if cls is None:
+        def __init__(self, owner: str, initial_balance: float = 0.0,
+                     history_capacity: int | None = None):
+            BankAccount.__init__(self, owner, initial_balance, currency, history_capacity)
+
+        def __reduce_ex__(self, protocol):
+            # Клас не доступний за іменем у модулі, тому відновлюється через make_account_class().
+            return (_restore_currency, (currency, self._frozen), self.__getstate__())
+
+        cls = type(f"BankAccount_{currency}", (BankAccount,), {
+            "__slots__": (),
+            "__init__": __init__,
+            "__reduce_ex__": __reduce_ex__,
+            "currency": _fixed_currency(currency),
+            "transfer": _transfer_same_currency,
+        })
+        _currency_classes[currency] = cls
+    return cls
@@ -1,8 +1,11 @@
 import unittest
 import sys
 import os
+import pickle
+from decimal import Decimal
+from fractions import Fraction
 
-from finance_manager import BankAccount
+from finance_manager import BankAccount, make_account_class
 
 class TestBankAccountExpanded(unittest.TestCase):
     """
@@ -38,6 +41,19 @@ class TestBankAccountExpanded(unittest.TestCase):
         self.assertEqual(self.acc_uah.currency, "UAH")
         self.assertFalse(self.acc_uah.is_frozen)
 
+    def test_init_str_subclass_currency(self):
+        """
+        @brief Тест створення рахунку з валютою підкласу str (наприклад, StrEnum).
+        @details Такий рахунок має приймати перекази з рахунку зі звичайним рядком валюти.
+        """
+        class Currency(str):
+            pass
+
+        acc = BankAccount("Sub User", 0.0, Currency("UAH"))
+        self.assertEqual(acc.currency, "UAH")
+        self.acc_uah.transfer(acc, 100.0)
+        self.assertEqual(acc.balance, 100.0)
+
     def test_init_negative_balance(self):
         """
         @brief Тест заборони створення рахунку з від'ємним балансом.
@@ -90,6 +106,23 @@ class TestBankAccountExpanded(unittest.TestCase):
         with self.assertRaises(PermissionError):
             self.acc_uah.deposit(100)
 
+    def test_deposit_unchecked(self):
+        """
+        @brief Тест поповнення без перевірок.
+        @details Перевіряє оновлення балансу та запис в історії, як і для deposit().
+        """
+        self.assertEqual(self.acc_uah.deposit_unchecked(250), 1250.0)
+        self.assertEqual(self.acc_uah.get_history()[-1]['action'], "Поповнення")
+
+    def test_deposit_unchecked_frozen_account(self):
+        """
+        @brief Тест поповнення без перевірок для замороженого рахунку.
+        @details deposit_unchecked() не перевіряє стан рахунку, тож заморожування його не блокує.
+        """
+        self.acc_uah.freeze_account()
+        self.assertEqual(self.acc_uah.deposit_unchecked(100), 1100.0)
+        self.assertTrue(self.acc_uah.is_frozen)
+
     # === Блок 3: Зняття (Withdraw) ===
 
     def test_withdraw_success(self):
@@ -125,6 +158,14 @@ class TestBankAccountExpanded(unittest.TestCase):
         with self.assertRaises(PermissionError):
             self.acc_uah.withdraw(100)
 
+    def test_withdraw_unchecked(self):
+        """
+        @brief Тест зняття без перевірок.
+        @details Перевіряє оновлення балансу та запис в історії, як і для withdraw().
+        """
+        self.assertEqual(self.acc_uah.withdraw_unchecked(250), 750.0)
+        self.assertEqual(self.acc_uah.get_history()[-1]['amount'], -250.0)
+
     # === Блок 4: Управління статусом (Freeze/Unfreeze) ===
 
     def test_freeze_account(self):
@@ -148,6 +189,58 @@ class TestBankAccountExpanded(unittest.TestCase):
         self.acc_uah.deposit(100)
         self.assertEqual(self.acc_uah.balance, 1100.0)
 
+    def test_freeze_keeps_account_type(self):
+        """
+        @brief Тест збереження типу рахунку при заморожуванні.
+        @details Заморожений рахунок лишається BankAccount, а після розморожування повертається до вихідного класу.
+        """
+        self.acc_uah.freeze_account()
+        self.assertIsInstance(self.acc_uah, BankAccount)
+        with self.assertRaises(PermissionError):
+            self.acc_uah.apply_interest(5)
+        self.acc_uah.unfreeze_account()
+        self.assertIs(type(self.acc_uah), BankAccount)
+
+    def test_is_frozen_assignment(self):
+        """
+        @brief Тест прямого присвоєння прапорця is_frozen.
+        @details Присвоєння is_frozen має заморожувати та розморожувати рахунок так само, як відповідні методи.
+        """
+        self.acc_uah.is_frozen = True
+        with self.assertRaises(PermissionError):
+            self.acc_uah.deposit(5)
+        self.acc_uah.unfreeze_account()
+        self.assertFalse(self.acc_uah.is_frozen)
+        self.acc_uah.freeze_account()
+        self.acc_uah.is_frozen = False
+        self.assertEqual(self.acc_uah.deposit(5), 1005.0)
+
+    def test_account_pickle_all_protocols(self):
+        """
+        @brief Тест серіалізації рахунку всіма протоколами pickle.
+        @details Баланс, валюта та історія мають відновлюватися, зокрема для протоколів 0 та 1.
+        """
+        self.acc_uah.deposit(100)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(self.acc_uah, protocol))
+            self.assertEqual(restored.balance, 1100.0)
+            self.assertEqual(restored.currency, "UAH")
+            self.assertEqual(restored.get_history(), self.acc_uah.get_history())
+
+    def test_frozen_account_pickle(self):
+        """
+        @brief Тест серіалізації замороженого рахунку.
+        @details Після pickle/unpickle рахунок лишається замороженим зі збереженим балансом.
+        """
+        self.acc_uah.freeze_account()
+        restored = pickle.loads(pickle.dumps(self.acc_uah))
+        self.assertTrue(restored.is_frozen)
+        self.assertEqual(restored.balance, 1000.0)
+        with self.assertRaises(PermissionError):
+            restored.withdraw(100)
+        restored.unfreeze_account()
+        self.assertIs(type(restored), BankAccount)
+
     # === Блок 5: Перекази (Transfer) ===
 
     def test_transfer_success(self):
@@ -189,6 +282,34 @@ class TestBankAccountExpanded(unittest.TestCase):
         with self.assertRaises(PermissionError):
             self.acc_uah.transfer(receiver, 100.0)
         self.assertEqual(self.acc_uah.balance, 1000.0) # Баланс не змінився
+        self.assertEqual(len(self.acc_uah.get_history()), 1) # Історія не змінилася
+
+    def test_transfer_history_single_record(self):
+        """
+        @brief Тест запису переказу в історії відправника.
+        @details Переказ має створювати рівно один запис з ім'ям отримувача.
+        """
+        receiver = BankAccount("Receiver", 0.0, "UAH")
+        self.acc_uah.transfer(receiver, 300.0)
+        history = self.acc_uah.get_history()
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history[-1]['action'], "Переказ до Receiver")
+        self.assertEqual(history[-1]['amount'], -300.0)
+        self.assertEqual(history[-1]['balance_after'], 700.0)
+
+    def test_transfer_from_frozen_account(self):
+        """
+        @brief Тест заборони переказу із замороженого рахунку.
+        @throws PermissionError Для transfer() та transfer_many(); баланси не змінюються.
+        """
+        receiver = BankAccount("Receiver", 0.0, "UAH")
+        self.acc_uah.freeze_account()
+        with self.assertRaises(PermissionError):
+            self.acc_uah.transfer(receiver, 100.0)
+        with self.assertRaises(PermissionError):
+            self.acc_uah.transfer_many([(receiver, 100.0)])
+        self.assertEqual(self.acc_uah.balance, 1000.0)
+        self.assertEqual(receiver.balance, 0.0)
 
     def test_transfer_invalid_type(self):
         """
@@ -198,6 +319,128 @@ class TestBankAccountExpanded(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.acc_uah.transfer("Not An Account Object", 100)
 
+    def test_transfer_many_success(self):
+        """
+        @brief Тест успішного пакетного переказу.
+        @details Перевіряє списання загальної суми та окремі записи в історії для кожного отримувача.
+        """
+        first = BankAccount("First", 0.0, "UAH")
+        second = BankAccount("Second", 0.0, "UAH")
+        self.acc_uah.transfer_many([(first, 100.0), (second, 250.0)])
+        self.assertEqual(self.acc_uah.balance, 650.0)
+        self.assertEqual(first.balance, 100.0)
+        self.assertEqual(second.balance, 250.0)
+        history = self.acc_uah.get_history()
+        self.assertEqual(history[-2]['action'], "Переказ до First")
+        self.assertEqual(history[-1]['action'], "Переказ до Second")
+
+    def test_transfer_many_insufficient_funds(self):
+        """
+        @brief Тест пакетного переказу, загальна сума якого перевищує баланс.
+        @throws ValueError Недостатньо коштів; жоден рахунок не змінюється.
+        """
+        receiver = BankAccount("Receiver", 0.0, "UAH")
+        with self.assertRaises(ValueError):
+            self.acc_uah.transfer_many([(receiver, 600.0), (receiver, 600.0)])
+        self.assertEqual(self.acc_uah.balance, 1000.0)
+        self.assertEqual(receiver.balance, 0.0)
+
+    def test_transfer_many_matches_sequential_transfers(self):
+        """
+        @brief Тест перевірки коштів у пакетному переказі з дробовими сумами.
+        @details Пакет приймається або відхиляється так само, як послідовні виклики transfer(),
+        і баланс відправника ніколи не стає від'ємним через округлення.
+        """
+        sender = BankAccount("Sender", 0.6, "UAH")
+        receiver = BankAccount("Receiver", 0.0, "UAH")
+        sender.transfer_many([(receiver, 0.1), (receiver, 0.2), (receiver, 0.3)])
+        self.assertGreaterEqual(sender.balance, 0.0)
+        self.assertEqual([r['balance_after'] for r in sender.get_history()[1:]],
+                         [0.6 - 0.1, 0.6 - 0.1 - 0.2, sender.balance])
+
+        sender = BankAccount("Sender", 5.14, "UAH")
+        with self.assertRaises(ValueError):
+            sender.transfer_many([(receiver, 0.44), (receiver, 3.32), (receiver, 0.55), (receiver, 0.83)])
+        self.assertEqual(sender.balance, 5.14)
+
+    def test_transfer_many_frozen_recipient(self):
+        """
+        @brief Тест пакетного переказу із замороженим отримувачем.
+        @details Якщо один з отримувачів заморожений, жоден рахунок пакета не змінюється.
+        """
+        first = BankAccount("First", 0.0, "UAH")
+        frozen = BankAccount("Frozen", 0.0, "UAH")
+        frozen.freeze_account()
+        with self.assertRaises(PermissionError):
+            self.acc_uah.transfer_many([(first, 100.0), (frozen, 100.0)])
+        self.assertEqual(self.acc_uah.balance, 1000.0)
+        self.assertEqual(first.balance, 0.0)
+        self.assertEqual(len(first.get_history()), 1)
+
+    def test_currency_class_transfer(self):
+        """
+        @brief Тест переказу між рахунками класу, спеціалізованого для валюти.
+        @details Клас кешується для валюти, а переказ працює як з рахунками свого класу, так і з BankAccount.
+        """
+        AccountUAH = make_account_class("UAH")
+        self.assertIs(make_account_class("UAH"), AccountUAH)
+        sender = AccountUAH("Sender", 500.0)
+        receiver = AccountUAH("Receiver")
+        self.assertEqual(sender.currency, "UAH")
+        sender.transfer(receiver, 200.0)
+        sender.transfer(self.acc_empty, 100.0)
+        self.assertEqual(sender.balance, 200.0)
+        self.assertEqual(receiver.balance, 200.0)
+        self.assertEqual(self.acc_empty.balance, 100.0)
+        with self.assertRaises(ValueError):
+            sender.transfer(self.acc_usd, 50.0)
+
+    def test_currency_class_currency_read_only(self):
+        """
+        @brief Тест незмінності валюти рахунку класу, спеціалізованого для валюти.
+        @throws AttributeError Валюту такого рахунку не можна змінити на іншу.
+        """
+        acc = make_account_class("UAH")("Owner", 100.0)
+        with self.assertRaises(AttributeError):
+            acc.currency = "USD"
+        self.assertEqual(acc.currency, "UAH")
+
+    def test_currency_class_pickle(self):
+        """
+        @brief Тест серіалізації рахунків класу, спеціалізованого для валюти.
+        @details Активний і заморожений рахунки відновлюються з тим самим класом, станом і балансом.
+        """
+        AccountUAH = make_account_class("UAH")
+        active = AccountUAH("Active", 10.0)
+        frozen = AccountUAH("Frozen", 20.0)
+        frozen.freeze_account()
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(active, protocol))
+            self.assertIs(type(restored), AccountUAH)
+            self.assertEqual(restored.balance, 10.0)
+            self.assertEqual(restored.currency, "UAH")
+
+            restored = pickle.loads(pickle.dumps(frozen, protocol))
+            self.assertTrue(restored.is_frozen)
+            with self.assertRaises(PermissionError):
+                restored.deposit(5)
+            restored.unfreeze_account()
+            self.assertIs(type(restored), AccountUAH)
+            self.assertEqual(restored.balance, 20.0)
+
+    def test_currency_class_transfer_to_frozen(self):
+        """
+        @brief Тест переказу на заморожений рахунок класу, спеціалізованого для валюти.
+        @throws PermissionError Баланс відправника не змінюється.
+        """
+        AccountUAH = make_account_class("UAH")
+        sender = AccountUAH("Sender", 500.0)
+        receiver = AccountUAH("Receiver")
+        receiver.freeze_account()
+        with self.assertRaises(PermissionError):
+            sender.transfer(receiver, 100.0)
+        self.assertEqual(sender.balance, 500.0)
+
     # === Блок 6: Відсотки та Історія ===
 
     def test_apply_interest(self):
@@ -208,6 +451,37 @@ class TestBankAccountExpanded(unittest.TestCase):
         self.acc_uah.apply_interest(10) # 10%
         self.assertEqual(self.acc_uah.balance, 1100.0)
 
+    def test_apply_interest_label_keeps_rate_type(self):
+        """
+        @brief Тест підпису операції нарахування для ставок різних типів.
+        @details Підпис має відповідати типу переданої ставки незалежно від попередніх викликів.
+        """
+        self.acc_uah.apply_interest(2.5)
+        self.acc_empty.apply_interest(Fraction(5, 2))
+        self.assertEqual(self.acc_uah.get_history()[-1]['action'], "Відсотки (2.5%)")
+        self.assertEqual(self.acc_empty.get_history()[-1]['action'], "Відсотки (5/2%)")
+
+    def test_apply_interest_whole_rate_exact(self):
+        """
+        @brief Тест нарахування цілої ставки без похибки округлення.
+        @details 14% на 1000.0 має давати рівно 1140.0 (як у окремому, так і в груповому нарахуванні).
+        """
+        self.acc_uah.apply_interest(14)
+        self.assertEqual(self.acc_uah.balance, 1140.0)
+        self.assertIn("Баланс: 1140.0 UAH", str(self.acc_uah))
+        other = BankAccount("Other", 1000.0, "UAH")
+        self.assertEqual(BankAccount.apply_interest_bulk([other], 14), [1140.0])
+
+    def test_apply_interest_decimal(self):
+        """
+        @brief Тест нарахування відсотків на рахунок у Decimal з Decimal-ставкою.
+        @details Баланс і сума відсотків мають лишатися точними Decimal-значеннями.
+        """
+        acc = BankAccount("Decimal User", Decimal("100"), "UAH")
+        self.assertEqual(acc.apply_interest(Decimal("5")), Decimal("105.00"))
+        self.assertEqual(acc.get_history()[-1]['amount'], Decimal("5.00"))
+        self.assertEqual(BankAccount.apply_interest_bulk([acc], Decimal("10")), [Decimal("115.5000")])
+
     def test_apply_interest_invalid(self):
         """
         @brief Тест нарахування з некоректною ставкою.
@@ -216,6 +490,37 @@ class TestBankAccountExpanded(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.acc_uah.apply_interest(-5)
 
+    def test_apply_interest_bulk(self):
+        """
+        @brief Тест групового нарахування відсотків.
+        @details Перевіряє, що кожен рахунок групи отримує відсотки та запис в історії.
+        """
+        balances = BankAccount.apply_interest_bulk([self.acc_uah, self.acc_empty], 10)
+        self.assertEqual(balances, [1100.0, 0.0])
+        self.assertEqual(self.acc_uah.balance, 1100.0)
+        self.assertEqual(self.acc_uah.get_history()[-1]['action'], "Відсотки (10%)")
+
+    def test_apply_interest_bulk_per_account_rates(self):
+        """
+        @brief Тест групового нарахування з окремою ставкою для кожного рахунку.
+        @throws ValueError Якщо кількість ставок не збігається з кількістю рахунків.
+        """
+        balances = BankAccount.apply_interest_bulk([self.acc_uah, self.acc_usd], [10, 20])
+        self.assertEqual(balances, [1100.0, 600.0])
+        self.assertEqual(self.acc_usd.get_history()[-1]['action'], "Відсотки (20%)")
+        with self.assertRaises(ValueError):
+            BankAccount.apply_interest_bulk([self.acc_uah, self.acc_usd], [10])
+
+    def test_apply_interest_bulk_frozen(self):
+        """
+        @brief Тест групового нарахування, якщо один з рахунків заморожено.
+        @throws PermissionError Жоден баланс групи не змінюється.
+        """
+        self.acc_empty.freeze_account()
+        with self.assertRaises(PermissionError):
+            BankAccount.apply_interest_bulk([self.acc_uah, self.acc_empty], 10)
+        self.assertEqual(self.acc_uah.balance, 1000.0)
+
     def test_transaction_history_logging(self):
         """
         @brief Тест запису історії транзакцій.
@@ -231,5 +536,49 @@ class TestBankAccountExpanded(unittest.TestCase):
         self.assertEqual(history[1]['amount'], 500)
         self.assertEqual(history[2]['action'], "Зняття")
 
+    def test_iter_history(self):
+        """
+        @brief Тест послідовного перегляду історії.
+        @details iter_history() має повертати ті самі записи, що й get_history().
+        """
+        self.acc_uah.deposit(500)
+        self.assertEqual(list(self.acc_uah.iter_history()), self.acc_uah.get_history())
+
+    def test_history_capacity(self):
+        """
+        @brief Тест обмеженої історії транзакцій.
+        @details Перевіряє, що при заданому history_capacity зберігаються лише останні записи.
+        """
+        acc = BankAccount("Limited", 0.0, "UAH", history_capacity=2)
+        acc.deposit(100)
+        acc.withdraw(40)
+        history = acc.get_history()
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history[0]['action'], "Поповнення")
+        self.assertEqual(history[1]['balance_after'], 60.0)
+
+    def test_history_keeps_value_types(self):
+        """
+        @brief Тест збереження типів сум в історії.
+        @details Історія має містити ті самі значення, що й баланс, в обох режимах зберігання.
+        """
+        for capacity in (None, 10):
+            acc = BankAccount("Int User", 0, "UAH", history_capacity=capacity)
+            acc.deposit(10 ** 400)
+            acc.deposit(Decimal("0.10"))
+            history = acc.get_history()
+            self.assertEqual(len(history), 3)
+            self.assertEqual(history[1]['amount'], 10 ** 400)
+            self.assertIsInstance(history[2]['amount'], Decimal)
+            self.assertEqual(history[2]['balance_after'], acc.balance)
+
+    def test_history_capacity_invalid(self):
+        """
+        @brief Тест створення рахунку з некоректним розміром історії.
+        @throws ValueError history_capacity має бути додатним.
+        """
+        with self.assertRaises(ValueError):
+            BankAccount("Bad User", 0.0, "UAH", history_capacity=0)
+
 if __name__ == '__main__':
     unittest.main()